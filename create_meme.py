@@ -3,22 +3,146 @@ Create a four-panel statistics meme illustrating selection bias.
 """
 
 from pathlib import Path
+import warnings
 import numpy as np
-from PIL import Image
-import matplotlib.pyplot as plt
+from PIL import Image, ImageColor, ImageDraw
+from step1_prepare_image import _to_uint8, _to_unit_float, prepare_image, to_grayscale
+from step2_create_stipple import create_stipple
+from step4_create_block_letter import _load_font, create_block_letter_s
+from step5_create_masked import create_masked_stipple
 
 
-def _prepare_image(img: np.ndarray, target_size: tuple[int, int]) -> np.ndarray:
-    """Normalize to [0,1], convert to grayscale, and resize to target_size."""
-    arr = np.asarray(img, dtype=np.float32)
-    arr = np.clip(arr, 0.0, 1.0)
-    if arr.ndim == 3:
-        arr = arr.mean(axis=2)
+def _prepare_image(
+    img: np.ndarray,
+    target_size: tuple[int, int],
+    resample: Image.Resampling = Image.Resampling.BILINEAR
+) -> np.ndarray:
+    """Normalize to [0,1], convert to grayscale, and resize to target_size.
+
+    Grayscale arrays already at ``target_size`` skip the Pillow round-trip:
+    they are returned as-is when within [0, 1] and clipped otherwise, so
+    panels from the standard pipeline cost only a bounds check. Panels only
+    need small size adjustments here, so the default filter is BILINEAR
+    rather than LANCZOS.
+    """
+    arr = to_grayscale(np.asarray(img, dtype=np.float32))
     if arr.ndim != 2:
         raise ValueError("Images must be 2D or convertible to grayscale")
-    pil_img = Image.fromarray((arr * 255).astype(np.uint8), mode="L")
-    pil_img = pil_img.resize((target_size[1], target_size[0]), Image.Resampling.LANCZOS)
-    return np.array(pil_img, dtype=np.float32) / 255.0
+    if arr.shape == tuple(target_size):
+        if arr.min() >= 0.0 and arr.max() <= 1.0:
+            return arr
+        return np.clip(arr, 0.0, 1.0)
+    # _to_uint8 saturates out-of-range values, so no separate clip is needed
+    pil_img = Image.fromarray(_to_uint8(arr), mode="L")
+    pil_img = pil_img.resize((target_size[1], target_size[0]), resample)
+    return _to_unit_float(pil_img)
+
+
+def _background_rgb(color: str) -> tuple[int, int, int]:
+    """Resolve a Pillow or matplotlib color spec to an 8-bit RGB triple."""
+    try:
+        return ImageColor.getrgb(color)[:3]
+    except ValueError:
+        pass
+    try:
+        from matplotlib.colors import to_rgb
+    except ImportError:
+        raise ValueError(f"unknown background color: {color!r}") from None
+    return tuple(int(round(c * 255)) for c in to_rgb(color))
+
+
+def _fast_save_meme(
+    panels: list[tuple[str, np.ndarray]],
+    output_path: Path,
+    background_color: str = "white"
+) -> None:
+    """Compose equally sized panels side by side with titles and write a PNG via Pillow."""
+    h, w = panels[0][1].shape
+    n = len(panels)
+    
+    # Shrink the title font until the longest title fits within a panel
+    font_size = max(12, h // 14)
+    font = _load_font(font_size)
+    longest = max(font.getlength(title) for title, _ in panels)
+    if longest > 0.95 * w:
+        font_size = max(6, int(font_size * 0.95 * w / longest))
+        font = _load_font(font_size)
+    title_h = 2 * font_size
+    gap = max(4, w // 20)
+    
+    # Build an RGB mosaic in NumPy (grayscale panels on the background color),
+    # then draw the titles on top
+    mosaic = np.empty((title_h + h + gap, n * w + (n + 1) * gap, 3), dtype=np.uint8)
+    mosaic[...] = _background_rgb(background_color)
+    gray = np.empty((h, w), dtype=np.uint8)
+    for k, (_, img) in enumerate(panels):
+        x0 = gap + k * (w + gap)
+        mosaic[title_h:title_h + h, x0:x0 + w] = _to_uint8(img, out=gray)[:, :, None]
+    
+    canvas = Image.fromarray(mosaic, mode="RGB")
+    draw = ImageDraw.Draw(canvas)
+    for k, (title, _) in enumerate(panels):
+        x0 = gap + k * (w + gap)
+        text_w = draw.textlength(title, font=font)
+        draw.text((x0 + (w - text_w) / 2, font_size // 2), title, fill=(0, 0, 0), font=font)
+    
+    # Fast deflate: previews are not worth the cost of maximum compression
+    canvas.save(output_path, optimize=False, compress_level=1)
+
+
+# Reusable matplotlib figures keyed by (base_h, base_w, dpi, background_color)
+_FIGURE_CACHE: dict[tuple, tuple] = {}
+_FIGURE_CACHE_SIZE = 4
+
+
+def _matplotlib_figure(
+    panels: list[tuple[str, np.ndarray]],
+    dpi: int,
+    background_color: str
+) -> tuple:
+    """Return a cached (figure, images, bbox) for the panel layout, building it on first use."""
+    base_h, base_w = panels[0][1].shape
+    key = (base_h, base_w, dpi, background_color)
+    if key in _FIGURE_CACHE:
+        return _FIGURE_CACHE[key]
+    
+    from matplotlib import rcParams
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    fig_w = 16
+    fig_h = 4.5
+    fig = Figure(figsize=(fig_w, fig_h), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_facecolor(background_color)
+    axes = fig.subplots(1, len(panels))
+    
+    images = []
+    for ax, (title, img) in zip(axes, panels):
+        images.append(ax.imshow(img, cmap="gray", vmin=0, vmax=1))
+        ax.set_title(title, fontsize=14, fontweight="bold", pad=10)
+        ax.axis("off")
+        ax.set_facecolor(background_color)
+    
+    fig.tight_layout(pad=2.0)
+    
+    # The layout is fixed for a given panel shape, so compute the tight crop once
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(rcParams["savefig.pad_inches"])
+    
+    if len(_FIGURE_CACHE) >= _FIGURE_CACHE_SIZE:
+        _FIGURE_CACHE.clear()
+    _FIGURE_CACHE[key] = (fig, images, bbox)
+    return fig, images, bbox
+
+
+def _warn_dpi_ignored(stacklevel: int) -> None:
+    """Warn that ``dpi`` has no effect without matplotlib, attributed ``stacklevel`` frames up."""
+    warnings.warn(
+        "dpi is ignored by the Pillow output path, which writes panels at "
+        "their native resolution; pass use_matplotlib=True for DPI control",
+        UserWarning,
+        stacklevel=stacklevel,
+    )
 
 
 def create_statistics_meme(
@@ -27,8 +151,9 @@ def create_statistics_meme(
     block_letter_img: np.ndarray,
     masked_stipple_img: np.ndarray,
     output_path: str,
-    dpi: int = 150,
-    background_color: str = "white"
+    dpi: int | None = None,
+    background_color: str = "white",
+    use_matplotlib: bool = False
 ) -> None:
     """
     Assemble a 1x4 panel meme and save to disk.
@@ -40,21 +165,25 @@ def create_statistics_meme(
     stipple_img : np.ndarray
         Stippled image (model panel).
     block_letter_img : np.ndarray
-        Block letter mask (selection bias panel).
+        Block letter mask (selection bias panel). Generate it at the size of
+        ``original_img`` (e.g. ``create_block_letter_s(*original_img.shape)``)
+        so it needs no resizing.
     masked_stipple_img : np.ndarray
         Stippled image with mask applied (estimate panel).
     output_path : str
         Where to save the PNG.
-    dpi : int
-        Output DPI; higher = sharper.
+    dpi : int | None
+        Output DPI; higher = sharper. Only used with ``use_matplotlib=True``
+        (default 150); passing it without matplotlib emits a warning.
     background_color : str
         Figure background color.
+    use_matplotlib : bool
+        If True, render the figure with matplotlib (slower, suited to high-DPI
+        publication output). If False, compose the panels at their native
+        resolution and write the PNG directly with Pillow. Default False.
     """
     # Use the original image size as the canonical panel size
-    if original_img.ndim == 3:
-        base_arr = np.mean(original_img, axis=2)
-    else:
-        base_arr = np.asarray(original_img, dtype=np.float32)
+    base_arr = to_grayscale(np.asarray(original_img, dtype=np.float32))
     if base_arr.ndim != 2:
         raise ValueError("original_img must be 2D or convertible to grayscale")
     base_arr = np.clip(base_arr, 0.0, 1.0)
@@ -62,25 +191,96 @@ def create_statistics_meme(
     
     panels = [
         ("Reality", base_arr),
-        ("Your Model", _prepare_image(stipple_img, (base_h, base_w))),
-        ("Selection Bias", _prepare_image(block_letter_img, (base_h, base_w))),
-        ("Estimate", _prepare_image(masked_stipple_img, (base_h, base_w))),
+        # Nearest-neighbour keeps the essentially binary mask panels crisp
+        ("Your Model", _prepare_image(
+            stipple_img, (base_h, base_w), Image.Resampling.BILINEAR)),
+        ("Selection Bias", _prepare_image(
+            block_letter_img, (base_h, base_w), Image.Resampling.NEAREST)),
+        ("Estimate", _prepare_image(
+            masked_stipple_img, (base_h, base_w), Image.Resampling.NEAREST)),
     ]
     
-    fig_w = 16
-    fig_h = 4.5
-    fig, axes = plt.subplots(1, 4, figsize=(fig_w, fig_h), constrained_layout=False)
-    fig.patch.set_facecolor(background_color)
+    out_path = Path(output_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     
-    for ax, (title, img) in zip(axes, panels):
-        ax.imshow(img, cmap="gray", vmin=0, vmax=1)
-        ax.set_title(title, fontsize=14, fontweight="bold", pad=10)
-        ax.axis("off")
-        ax.set_facecolor(background_color)
+    if not use_matplotlib:
+        if dpi is not None:
+            _warn_dpi_ignored(stacklevel=3)
+        _fast_save_meme(panels, out_path, background_color)
+        return
     
-    plt.tight_layout(pad=2.0)
+    if dpi is None:
+        dpi = 150
     
-    out_path = Path(output_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out_path, dpi=dpi, bbox_inches="tight", facecolor=background_color)
-    plt.close(fig)
+    fig, images, bbox = _matplotlib_figure(panels, dpi, background_color)
+    for image, (_, img) in zip(images, panels):
+        image.set_data(img)
+    fig.savefig(out_path, dpi=dpi, bbox_inches=bbox, facecolor=background_color)
+
+
+def make_meme(
+    image_path: str,
+    output_path: str,
+    max_size: int = 512,
+    target_size: tuple[int, int] | None = None,
+    letter: str = "S",
+    font_size_ratio: float = 0.9,
+    threshold: float = 0.5,
+    dpi: int | None = None,
+    background_color: str = "white",
+    use_matplotlib: bool = False,
+    **stipple_params
+) -> None:
+    """
+    Run the full pipeline from an image file to the saved four-panel meme.
+    
+    One canonical (height, width) float32 grayscale array is prepared and
+    every later stage produces its panel at exactly that size and dtype,
+    so `create_statistics_meme` passes all panels through without resizing.
+    
+    Parameters
+    ----------
+    image_path : str
+        Path to the input image file.
+    output_path : str
+        Where to save the PNG.
+    max_size : int
+        Maximum dimension when ``target_size`` is None (see `prepare_image`).
+    target_size : tuple[int, int] | None
+        Optional exact (width, height) for the prepared image.
+    letter : str
+        Letter used for the selection-bias mask (default "S").
+    font_size_ratio : float
+        Font size relative to the image, passed to `create_block_letter_s`.
+    threshold : float
+        Mask threshold, passed to `create_masked_stipple`.
+    dpi : int | None
+        Output DPI; only used with ``use_matplotlib=True`` (default 150).
+    background_color : str
+        Figure background color.
+    use_matplotlib : bool
+        Render with matplotlib instead of the Pillow fast path.
+    **stipple_params
+        Extra keyword arguments for `create_stipple` (e.g. ``percentage``,
+        ``sigma``, ``content_bias``).
+    """
+    # Warn here so the warning points at the caller of make_meme
+    if dpi is not None and not use_matplotlib:
+        _warn_dpi_ignored(stacklevel=3)
+        dpi = None
+    
+    gray_img = prepare_image(image_path, max_size=max_size, target_size=target_size)
+    h, w = gray_img.shape
+    stipple_img, _ = create_stipple(gray_img, **stipple_params)
+    block_letter_img = create_block_letter_s(h, w, letter=letter, font_size_ratio=font_size_ratio)
+    masked_stipple_img = create_masked_stipple(stipple_img, block_letter_img, threshold=threshold)
+    create_statistics_meme(
+        gray_img,
+        stipple_img,
+        block_letter_img,
+        masked_stipple_img,
+        output_path,
+        dpi=dpi,
+        background_color=background_color,
+        use_matplotlib=use_matplotlib
+    )
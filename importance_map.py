@@ -5,6 +5,100 @@ This function identifies which regions of the image should receive more stipples
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to the NumPy implementation
+    numba = None
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _gauss_nb(d, inv_two_sigma_sq):
+        """exp(-d**2 * inv_two_sigma_sq) with the exponent argument formed in float64."""
+        # Tiny sigmas give reciprocals far beyond float32 range; forming the
+        # argument in float64 keeps 0 * inv finite, and an argument that only
+        # overflows float32 becomes -inf, whose exp is a clean 0
+        dd = np.float64(d)
+        return np.exp(np.float32(-(dd * dd) * inv_two_sigma_sq))
+    
+    # Infinity marks "no pixel found" in the scans, so keep the no-inf/no-nan
+    # guarantees; 'arcp' is also left out so the per-pixel divisions by the
+    # mask maxima are never turned into (possibly overflowing) reciprocals
+    @numba.njit(parallel=True, fastmath={'nsz', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _importance_nb(I, extreme_downweight, extreme_threshold_low, extreme_threshold_high,
+                       extreme_sigma, mid_tone_boost, mid_tone_center, mid_tone_sigma):
+        """
+        Numba kernel computing the whole importance map without temporaries.
+        
+        Equivalent to the NumPy code path of `compute_importance` for a
+        contiguous float32 image already clipped to [0, 1]. The per-mask
+        maxima used for normalization come from a cheap scan for the pixel
+        nearest each Gaussian's centre; a single pass then evaluates the
+        full formula, followed by the final min-max rescale.
+        """
+        g = I.ravel()
+        n = g.size
+        # Reciprocals stay float64 (capped at its max) so they never become inf
+        big = np.finfo(np.float64).max
+        two_e = 2.0 * np.float64(extreme_sigma) ** 2
+        two_m = 2.0 * np.float64(mid_tone_sigma) ** 2
+        inv_e = 1.0 / two_e if two_e > 1.0 / big else big
+        inv_m = 1.0 / two_m if two_m > 1.0 / big else big
+        k = np.float32(extreme_downweight)
+        boost = np.float32(mid_tone_boost)
+        
+        # Values nearest each Gaussian's centre give the masks' maxima
+        inf = np.float32(np.inf)
+        lo = np.float32(extreme_threshold_low)
+        hi = np.float32(extreme_threshold_high)
+        center = np.float32(mid_tone_center)
+        zero = np.float32(0.0)
+        one = np.float32(1.0)
+        dark_nearest = inf
+        light_nearest = -inf
+        mid_dist = inf
+        for idx in range(n):
+            v = g[idx]
+            dark_nearest = min(dark_nearest, v if v < lo else inf)
+            light_nearest = max(light_nearest, v if v > hi else -inf)
+            mid_dist = min(mid_dist, abs(v - center))
+        
+        # Evaluate each maximum with the same expression used per pixel,
+        # so a mask whose peak underflows stays all-zero as in the NumPy path
+        dark_max = zero
+        if dark_nearest < inf:
+            dark_max = _gauss_nb(dark_nearest, inv_e)
+        light_max = zero
+        if light_nearest > -inf:
+            light_max = _gauss_nb(light_nearest - one, inv_e)
+        mid_max = _gauss_nb(mid_dist, inv_m)
+        use_dark = dark_max > zero
+        use_light = light_max > zero
+        if not mid_max > zero:
+            mid_max = one  # Gaussian is zero everywhere; leave it unnormalized
+        
+        # Fused inversion, extreme-tone downweighting and mid-tone boost in float32
+        out = np.empty(n, dtype=np.float32)
+        for idx in numba.prange(n):
+            v = g[idx]
+            dark = zero
+            if use_dark and v < lo:
+                dark = _gauss_nb(v, inv_e) / dark_max
+            light = zero
+            if use_light and v > hi:
+                light = _gauss_nb(v - one, inv_e) / light_max
+            extreme = max(dark, light)
+            mid = _gauss_nb(v - center, inv_m) / mid_max
+            out[idx] = (one - v) * (one - k * extreme) * (one + boost * mid)
+        
+        # Normalize to [0,1]
+        m, M = out.min(), out.max()
+        if M > m:
+            scale = one / (M - m)
+            for idx in numba.prange(n):
+                out[idx] = (out[idx] - m) * scale
+        return out.reshape(I.shape)
+
 
 def compute_importance(
     gray_img: np.ndarray,
@@ -14,6 +108,7 @@ def compute_importance(
     extreme_sigma: float = 0.1,
     mid_tone_boost: float = 0.4,
     mid_tone_sigma: float = 0.2,
+    use_numba: bool = True,
 ):
     """
     Importance map computation that downweights extreme tones (very dark and very light)
@@ -35,6 +130,9 @@ def compute_importance(
         Strength of mid-tone emphasis (0.0 = no boost, 1.0 = strong boost)
     mid_tone_sigma : float
         Width of the mid-tone Gaussian bump (smaller = narrower, larger = wider)
+    use_numba : bool
+        If True and Numba is installed, compute the map with a fused compiled
+        kernel. Otherwise use the NumPy implementation.
     
     Returns
     -------
@@ -42,6 +140,18 @@ def compute_importance(
         Importance map in [0, 1]; higher = more stipples (dark areas and mid-tones get higher importance)
     """
     I = np.clip(gray_img, 0.0, 1.0)
+    mid_tone_center = 0.65
+    
+    if use_numba and numba is not None:
+        importance = _importance_nb(
+            np.ascontiguousarray(I, dtype=np.float32),
+            extreme_downweight, extreme_threshold_low, extreme_threshold_high,
+            extreme_sigma, mid_tone_boost, mid_tone_center, mid_tone_sigma
+        )
+        # The kernel works in float32; hand back the caller's float dtype
+        if I.dtype.kind == 'f':
+            importance = importance.astype(I.dtype, copy=False)
+        return importance
     
     # Invert brightness: dark areas should get more dots (higher importance)
     I_inverted = 1.0 - I
@@ -66,7 +176,6 @@ def compute_importance(
     importance = I_inverted * (1.0 - extreme_downweight * extreme_mask)
     
     # Add smooth gradual mid-tone boost (Gaussian centered on 0.65)
-    mid_tone_center = 0.65
     mid_tone_gaussian = np.exp(-((I - mid_tone_center) ** 2) / (2.0 * (mid_tone_sigma ** 2)))
     if mid_tone_gaussian.max() > 0:
         mid_tone_gaussian = mid_tone_gaussian / mid_tone_gaussian.max()
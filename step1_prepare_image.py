@@ -4,14 +4,62 @@ Loads an image, converts to grayscale, and resizes to appropriate dimensions
 while maintaining aspect ratio.
 """
 
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 
 
+# ITU-R BT.601 luma weights (the same ones Pillow uses for convert('L'))
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+_INV255 = np.float32(1.0 / 255.0)
+
+
+def _to_unit_float(pil_img: Image.Image) -> np.ndarray:
+    """Convert an 8-bit PIL image to a float32 array in [0, 1] in a single pass."""
+    return np.multiply(np.asarray(pil_img), _INV255, dtype=np.float32)
+
+
+def _to_uint8(arr: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Scale a [0, 1] array to uint8, saturating out-of-range values, optionally into ``out``."""
+    if out is None:
+        out = np.empty(arr.shape, dtype=np.uint8)
+    # Clip in a float32 scratch buffer; a direct unsafe cast would wrap around
+    scaled = np.multiply(arr, 255, dtype=np.float32)
+    np.clip(scaled, 0, 255, out=scaled)
+    np.copyto(out, scaled, casting='unsafe')
+    return out
+
+
+def to_grayscale(img: np.ndarray) -> np.ndarray:
+    """
+    Collapse a color image to grayscale with a single luma dot product.
+    
+    Parameters
+    ----------
+    img : np.ndarray
+        Image as 2D array (height, width) or 3D array (height, width, channels).
+        2D input is returned unchanged; any alpha channel is ignored.
+    
+    Returns
+    -------
+    gray : np.ndarray
+        Grayscale image as 2D array (height, width)
+    """
+    if img.ndim != 3:
+        return img
+    if img.shape[2] < 3:
+        return img[:, :, 0]
+    return img[..., :3] @ _LUMA_WEIGHTS
+
+
 def prepare_image(
-    img_path: str,
+    img_path: str | np.ndarray,
     max_size: int = 512,
-    target_size: tuple[int, int] | None = None
+    target_size: tuple[int, int] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS
 ) -> np.ndarray:
     """
     Load an image, convert to grayscale, and resize to appropriate dimensions
@@ -19,60 +67,117 @@ def prepare_image(
     
     Parameters
     ----------
-    img_path : str
-        Path to the input image file
+    img_path : str | np.ndarray
+        Path to the input image file, or an already-loaded image array
+        (grayscale or RGB): either uint8 in [0, 255] (e.g.
+        ``np.asarray(Image.open(path))``) or floating point in [0, 1]
     max_size : int
         Maximum dimension (width or height) if target_size is None.
         Image will be resized to fit within this size while maintaining aspect ratio.
     target_size : tuple[int, int] | None
         Optional target size (width, height). If provided, image will be resized
         to this size. If None, uses max_size to determine dimensions.
+    resample : Image.Resampling
+        Pillow resampling filter used when resizing. Default LANCZOS, which
+        gives the best quality for large first-time downscales; BILINEAR is
+        several times faster for modest scale factors. Installing
+        pillow-simd in place of Pillow speeds up every filter with no code
+        changes.
     
     Returns
     -------
     img_array : np.ndarray
         Grayscale image as 2D array (height, width) with values in [0, 1]
     """
-    # Load the image
-    original_img = Image.open(img_path)
-    
-    # Convert to grayscale if needed
-    if original_img.mode != 'L':
-        original_img = original_img.convert('L')
-    
-    # Convert to numpy array and normalize to [0, 1]
-    img_array = np.array(original_img, dtype=np.float32) / 255.0
+    if isinstance(img_path, np.ndarray):
+        # Already in memory: convert to grayscale directly, no decode needed
+        img_array = np.asarray(img_path)
+        if img_array.dtype == np.uint8:
+            img_array = np.multiply(img_array, _INV255, dtype=np.float32)
+        elif img_array.dtype.kind != 'f':
+            raise ValueError(
+                f"Image arrays must be uint8 or floating point, got {img_array.dtype}"
+            )
+        img_array = np.clip(to_grayscale(img_array.astype(np.float32, copy=False)), 0.0, 1.0)
+        if img_array.ndim != 2:
+            raise ValueError(f"Unexpected image shape: {img_array.shape}")
+        height, width = img_array.shape
+        original_img = None
+    else:
+        # Load the image
+        original_img = Image.open(img_path)
+        
+        # Convert to grayscale if needed
+        if original_img.mode != 'L':
+            original_img = original_img.convert('L')
+        width, height = original_img.size
     
-    # Resize if needed
+    # Decide the output size before materializing any float array
     if target_size is not None:
         # Resize to exact target size
-        new_size = target_size
-        img_resized_pil = original_img.resize(new_size, Image.Resampling.LANCZOS)
-        if img_resized_pil.mode != 'L':
-            img_resized_pil = img_resized_pil.convert('L')
-        img_resized = np.array(img_resized_pil, dtype=np.float32) / 255.0
-        #print(f"Resized image to target size: {img_resized.shape}")
-    elif img_array.shape[0] > max_size or img_array.shape[1] > max_size:
+        new_size = tuple(target_size)
+    elif height > max_size or width > max_size:
         # Resize to fit within max_size while maintaining aspect ratio
-        scale = max_size / max(img_array.shape[0], img_array.shape[1])
-        new_size = (int(img_array.shape[1] * scale), int(img_array.shape[0] * scale))
-        img_resized_pil = original_img.resize(new_size, Image.Resampling.LANCZOS)
-        if img_resized_pil.mode != 'L':
-            img_resized_pil = img_resized_pil.convert('L')
-        img_resized = np.array(img_resized_pil, dtype=np.float32) / 255.0
-        #print(f"Resized image from {img_array.shape} to {img_resized.shape} for processing")
+        scale = max_size / max(height, width)
+        new_size = (int(width * scale), int(height * scale))
     else:
-        img_resized = img_array.copy()
-        #print(f"Image size: {img_resized.shape} (no resizing needed)")
+        new_size = None
     
-    # Ensure img_resized is 2D grayscale
-    if len(img_resized.shape) > 2:
-        img_resized = img_resized[:, :, 0]
-    elif len(img_resized.shape) == 2:
-        pass
+    if original_img is None and new_size is None:
+        img_resized = img_array
     else:
-        raise ValueError(f"Unexpected image shape: {img_resized.shape}")
+        if original_img is None:
+            original_img = Image.fromarray(_to_uint8(img_array), mode='L')
+        if new_size is not None:
+            original_img = original_img.resize(new_size, resample)
+        # Convert to numpy array once and normalize to [0, 1]
+        img_resized = _to_unit_float(original_img)
     
     #print(f"Final image shape: {img_resized.shape} (should be 2D for grayscale)")
     return img_resized
 
+
+def iter_prepared_images(
+    img_paths: Iterable[str],
+    max_size: int = 512,
+    target_size: tuple[int, int] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    prefetch: int = 2
+) -> Iterator[np.ndarray]:
+    """
+    Prepare a sequence of images one at a time, decoding ahead in the background.
+    
+    Images are yielded in input order. Up to ``prefetch`` upcoming images are
+    loaded and resized in worker threads (Pillow releases the GIL while
+    decoding), so I/O overlaps with whatever the caller does with the
+    current image, without loading the whole batch into memory.
+    
+    Parameters
+    ----------
+    img_paths : Iterable[str]
+        Paths to the input image files
+    max_size : int
+        Passed through to `prepare_image`.
+    target_size : tuple[int, int] | None
+        Passed through to `prepare_image`.
+    resample : Image.Resampling
+        Passed through to `prepare_image`.
+    prefetch : int
+        Number of images to prepare ahead of the one being consumed. Default 2.
+    
+    Yields
+    ------
+    img_array : np.ndarray
+        Grayscale image as 2D array (height, width) with values in [0, 1]
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    
+    with ThreadPoolExecutor(max_workers=prefetch) as pool:
+        pending = deque()
+        for path in img_paths:
+            pending.append(pool.submit(prepare_image, path, max_size, target_size, resample))
+            if len(pending) > prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -18,6 +18,7 @@ def create_stipple(
     extreme_threshold_low: float = 0.2,
     extreme_threshold_high: float = 0.8,
     extreme_sigma: float = 0.1,
+    use_numba: bool = True,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Create a blue noise stippling pattern from a grayscale image.
@@ -45,6 +46,9 @@ def create_stipple(
         Threshold above which tones are considered "very light". Default 0.8.
     extreme_sigma : float
         Width of the smooth transition for extreme downweighting. Default 0.1.
+    use_numba : bool
+        Use the compiled importance-map and placement kernels when Numba is
+        installed. Default True.
     
     Returns
     -------
@@ -60,7 +64,8 @@ def create_stipple(
         extreme_downweight=extreme_downweight,
         extreme_threshold_low=extreme_threshold_low,
         extreme_threshold_high=extreme_threshold_high,
-        extreme_sigma=extreme_sigma
+        extreme_sigma=extreme_sigma,
+        use_numba=use_numba
     )
     # print("Importance map computed")
     
@@ -72,7 +77,8 @@ def create_stipple(
         sigma=sigma,
         content_bias=content_bias,
         importance_img=importance_map,
-        noise_scale_factor=noise_scale_factor
+        noise_scale_factor=noise_scale_factor,
+        use_numba=use_numba
     )
     
     # print(f"Generated {len(samples)} stipple points")
@@ -11,7 +11,8 @@ def create_tonal(
     gray_img: np.ndarray,
     grid_rows: int = 16,
     grid_cols: int = 12,
-    return_full_image: bool = True
+    return_full_image: bool = True,
+    legacy_coords: bool = False
 ) -> tuple[np.ndarray, np.ndarray, dict]:
     """
     Create a tonal analysis by dividing the image into a grid and computing
@@ -30,6 +31,9 @@ def create_tonal(
         If True, returns a full-size image with box-averaged values expanded
         to fill each grid cell. If False, returns just the grid array.
         Default True.
+    legacy_coords : bool
+        If True, stats['section_coords'] is a list of (row, col, tone) tuples
+        instead of a record array. Default False.
     
     Returns
     -------
@@ -46,48 +50,56 @@ def create_tonal(
         - 'std': Overall standard deviation
         - 'min': Minimum tone value
         - 'max': Maximum tone value
-        - 'section_coords': List of (row, col, tone) tuples for all sections
+        - 'section_coords': Record array with fields 'row', 'col' and 'tone'
+          for all sections in row-major order (a list of (row, col, tone)
+          tuples if legacy_coords=True)
     """
     h, w = gray_img.shape
     section_h = h // grid_rows
     section_w = w // grid_cols
     
-    # Create arrays to store average tones
-    average_tones = np.zeros((grid_rows, grid_cols))
-    section_coords = []
+    # Section boundaries; the last row/column absorbs any remainder
+    row_starts = np.arange(grid_rows) * section_h
+    col_starts = np.arange(grid_cols) * section_w
+    heights = np.diff(np.append(row_starts, h))
+    widths = np.diff(np.append(col_starts, w))
     
-    # Compute average tone for each section
-    for i in range(grid_rows):
-        for j in range(grid_cols):
-            y_start = i * section_h
-            y_end = (i + 1) * section_h if i < grid_rows - 1 else h
-            x_start = j * section_w
-            x_end = (j + 1) * section_w if j < grid_cols - 1 else w
-            
-            section = gray_img[y_start:y_end, x_start:x_end]
-            avg_tone = np.mean(section)
-            average_tones[i, j] = avg_tone
-            section_coords.append((i, j, avg_tone))
+    # Compute average tone for each section in a single block reduction
+    if h == grid_rows * section_h and w == grid_cols * section_w:
+        blocks = gray_img.reshape(grid_rows, section_h, grid_cols, section_w)
+        average_tones = blocks.mean(axis=(1, 3), dtype=np.float64)
+    else:
+        row_sums = np.add.reduceat(gray_img, row_starts, axis=0, dtype=np.float64)
+        block_sums = np.add.reduceat(row_sums, col_starts, axis=1)
+        average_tones = block_sums / (heights[:, None] * widths[None, :])
+    
+    # Section coordinates as one record array instead of per-cell tuples
+    rows, cols = np.indices((grid_rows, grid_cols))
+    section_coords = np.rec.fromarrays(
+        [rows.ravel(), cols.ravel(), average_tones.ravel()],
+        names='row,col,tone'
+    )
+    if legacy_coords:
+        section_coords = section_coords.tolist()
     
-    # Compute statistics
+    # Compute statistics from running sums (tones are bounded, so the
+    # sum-of-squares variance is numerically safe here)
+    flat = average_tones.ravel()
+    mean = flat.sum() / flat.size
+    variance = np.dot(flat, flat) / flat.size - mean * mean
     stats = {
-        'mean': np.mean(average_tones),
-        'std': np.std(average_tones),
-        'min': np.min(average_tones),
-        'max': np.max(average_tones),
+        'mean': mean,
+        'std': np.sqrt(max(variance, 0.0)),
+        'min': flat.min(),
+        'max': flat.max(),
         'section_coords': section_coords
     }
     
     # Create full-size image if requested
     if return_full_image:
-        tonal_img = np.zeros_like(gray_img)
-        for i in range(grid_rows):
-            for j in range(grid_cols):
-                y_start = i * section_h
-                y_end = (i + 1) * section_h if i < grid_rows - 1 else h
-                x_start = j * section_w
-                x_end = (j + 1) * section_w if j < grid_cols - 1 else w
-                tonal_img[y_start:y_end, x_start:x_end] = average_tones[i, j]
+        # Cast the small grid first so the expansion writes the output dtype directly
+        grid = average_tones.astype(gray_img.dtype, copy=False)
+        tonal_img = np.repeat(np.repeat(grid, heights, axis=0), widths, axis=1)
     else:
         tonal_img = average_tones
     
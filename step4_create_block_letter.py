@@ -13,37 +13,45 @@ Example
 >>> mask.shape
 (200, 300)
 
-The module relies on Pillow for drawing text; if a TrueType font matching
-the preferred names cannot be found, the code falls back to Pillow's
-default bitmap font.
+The module relies on Pillow for drawing text. A bold DejaVu Sans font is
+located through matplotlib's font manager when matplotlib is installed,
+otherwise by probing common font names; if no TrueType font can be found,
+the code falls back to Pillow's default bitmap font.
+
+Fonts and rendered masks are cached, so repeated calls with the same
+arguments return the same read-only array without redrawing.
 """
 
-from pathlib import Path
+from functools import lru_cache
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 
-def _load_font(size: int) -> ImageFont.ImageFont:
-    """Load a TrueType font at the requested size from common locations.
+_INV255 = np.float32(1.0 / 255.0)
 
-    The function probes a list of typical font filenames and platform
-    locations (Linux, macOS, common user installs) and returns the first
-    usable TTF font. If no suitable file is found, the Pillow default font
-    is returned.
 
-    Parameters
-    ----------
-    size : int
-        Requested font size in pixels. The caller is responsible for ensuring
-        ``size`` is positive; this function will pass the value directly to
-        Pillow's ``truetype`` loader.
+@lru_cache(maxsize=1)
+def _find_font_path() -> str | None:
+    """Locate a bold sans-serif TrueType font file once per process.
+
+    matplotlib's font manager is preferred: it keeps an on-disk index of
+    the system fonts and always ships DejaVu Sans itself. Without
+    matplotlib, a list of typical font filenames and platform locations
+    (Linux, macOS, common user installs) is probed with Pillow instead.
 
     Returns
     -------
-    ImageFont.ImageFont
-        A Pillow font instance sized approximately to ``size``. On fallback
-        the returned object may be a small bitmap font provided by Pillow.
+    str | None
+        Path (or Pillow-resolvable name) of the font, or None if no usable
+        TrueType font was found.
     """
+    try:
+        from matplotlib.font_manager import FontProperties, findfont
+    except ImportError:
+        pass
+    else:
+        return findfont(FontProperties(family="DejaVu Sans", weight="bold"))
+
     font_candidates = [
         "DejaVuSans-Bold.ttf",  # Pillow ships this on most installs
         "Arial Bold.ttf",
@@ -58,12 +66,40 @@ def _load_font(size: int) -> ImageFont.ImageFont:
     ]
     for font_path in font_candidates:
         try:
-            candidate = Path(font_path)
-            if candidate.exists():
-                return ImageFont.truetype(str(candidate), size=size)
-            return ImageFont.truetype(font_path, size=size)
+            ImageFont.truetype(font_path)
         except OSError:
             continue
+        return font_path
+    return None
+
+
+@lru_cache(maxsize=128)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load the block-letter TrueType font at the requested size.
+
+    The font file is located once by `_find_font_path`. If no suitable file
+    is found, the Pillow default font is returned. Results are cached per
+    ``size``.
+
+    Parameters
+    ----------
+    size : int
+        Requested font size in pixels. The caller is responsible for ensuring
+        ``size`` is positive; this function will pass the value directly to
+        Pillow's ``truetype`` loader.
+
+    Returns
+    -------
+    ImageFont.ImageFont
+        A Pillow font instance sized approximately to ``size``. On fallback
+        the returned object may be a small bitmap font provided by Pillow.
+    """
+    font_path = _find_font_path()
+    if font_path is not None:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except OSError:
+            pass
     return ImageFont.load_default()
 
 
@@ -94,6 +130,8 @@ def create_block_letter_s(
         2D array (height × width) with values in [0, 1]:
         - 0.0 where the letter is drawn (black)
         - 1.0 for the background (white)
+        The array is cached and shared between calls, so it is read-only;
+        take a ``.copy()`` before modifying it.
     """
     if height <= 0 or width <= 0:
         raise ValueError("height and width must be positive integers")
@@ -102,6 +140,17 @@ def create_block_letter_s(
     if font_size_ratio <= 0.0 or font_size_ratio > 1.0:
         raise ValueError("font_size_ratio must be between 0.0 and 1.0")
     
+    return _render_block_letter(int(height), int(width), letter, float(font_size_ratio))
+
+
+@lru_cache(maxsize=16)
+def _render_block_letter(
+    height: int,
+    width: int,
+    letter: str,
+    font_size_ratio: float
+) -> np.ndarray:
+    """Draw the block letter mask for validated arguments (cached)."""
     # Create a white canvas
     canvas = Image.new("L", (width, height), color=255)
     draw = ImageDraw.Draw(canvas)
@@ -110,11 +159,19 @@ def create_block_letter_s(
     font_size = max(1, int(min(height, width) * font_size_ratio))
     font = _load_font(font_size)
     
-    # Resize downward until the text fits comfortably within the target area
+    # Rescale so the text fits comfortably within the target area. Glyph
+    # extents scale roughly linearly with font size, so one measurement gives
+    # the fitted size; the loop only corrects rounding in the rare overshoot.
     max_width = max(1, int(width * font_size_ratio))
     max_height = max(1, int(height * font_size_ratio))
     bbox = draw.textbbox((0, 0), letter, font=font)
     text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    if (text_w > max_width or text_h > max_height) and font_size > 1:
+        factor = min(max_width / max(text_w, 1), max_height / max(text_h, 1))
+        font_size = max(1, int(font_size * factor))
+        font = _load_font(font_size)
+        bbox = draw.textbbox((0, 0), letter, font=font)
+        text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
     while (text_w > max_width or text_h > max_height) and font_size > 1:
         font_size = max(1, int(font_size * 0.9))
         font = _load_font(font_size)
@@ -127,4 +184,6 @@ def create_block_letter_s(
     draw.text((x, y), letter, fill=0, font=font)
     
     # Convert to normalized numpy array in [0, 1]
-    return np.array(canvas, dtype=np.float32) / 255.0
+    mask = np.multiply(np.asarray(canvas), _INV255, dtype=np.float32)
+    mask.setflags(write=False)
+    return mask
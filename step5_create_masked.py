@@ -5,10 +5,39 @@ Step 5: Apply the block letter mask to the stippled image to simulate selection
 import numpy as np
 
 
+def precompute_mask(
+    mask_img: np.ndarray,
+    threshold: float = 0.5
+) -> np.ndarray:
+    """
+    Threshold a block-letter mask once into a boolean array.
+    
+    Passing the result to `create_masked_stipple` skips the per-call float
+    comparison and reads 1 byte per pixel instead of 4, which pays off when
+    the same mask is applied repeatedly (e.g. across animation frames).
+    
+    Parameters
+    ----------
+    mask_img : np.ndarray
+        Mask image in [0, 1]; darker values indicate regions to remove.
+    threshold : float
+        Pixels in the mask below this value are treated as masked-out areas.
+    
+    Returns
+    -------
+    np.ndarray
+        Contiguous boolean array, True where stipples should be removed.
+    """
+    if not (0.0 <= threshold <= 1.0):
+        raise ValueError("threshold must be within [0, 1]")
+    return np.ascontiguousarray(np.asarray(mask_img) < threshold)
+
+
 def create_masked_stipple(
     stipple_img: np.ndarray,
     mask_img: np.ndarray,
-    threshold: float = 0.5
+    threshold: float = 0.5,
+    out: np.ndarray | None = None
 ) -> np.ndarray:
     """
     Apply a block-letter mask to a stippled image.
@@ -19,25 +48,32 @@ def create_masked_stipple(
         Stippled image (0.0 = black dots, 1.0 = white background).
     mask_img : np.ndarray
         Mask image in [0, 1]; darker values indicate regions to remove.
+        A boolean mask from `precompute_mask` is used as-is (True = remove).
     threshold : float
         Pixels in the mask below this value are treated as masked-out areas.
+        Ignored for boolean masks.
+    out : np.ndarray | None
+        Optional float32 buffer (same shape as the inputs) to write the result
+        into, so repeated calls can reuse one allocation. Default None.
     
     Returns
     -------
     np.ndarray
         Masked stippled image with the same shape as the inputs.
     """
-    stipple = np.asarray(stipple_img, dtype=np.float32)
-    mask = np.asarray(mask_img, dtype=np.float32)
+    stipple = np.asarray(stipple_img).astype(np.float32, copy=False)
+    mask = np.asarray(mask_img)
     
     if stipple.shape != mask.shape:
         raise ValueError("stipple_img and mask_img must have the same shape")
     if not (0.0 <= threshold <= 1.0):
         raise ValueError("threshold must be within [0, 1]")
     
-    masked = stipple.copy()
-    
     # Where the mask is dark, remove stipples by setting to white
-    masked[mask < threshold] = 1.0
+    removed = mask if mask.dtype == np.bool_ else mask < threshold
+    if out is None:
+        return np.where(removed, np.float32(1.0), stipple)
     
-    return np.clip(masked, 0.0, 1.0)
+    np.copyto(out, stipple)
+    np.copyto(out, 1.0, where=removed)
+    return out
@@ -0,0 +1,49 @@
+"""
+Tests comparing the compiled importance-map kernel against the NumPy path.
+"""
+
+import numpy as np
+import pytest
+
+import importance_map
+from importance_map import compute_importance
+
+pytestmark = pytest.mark.skipif(importance_map.numba is None, reason="numba not installed")
+
+rng = np.random.default_rng(0)
+
+IMAGES = {
+    "random": rng.random((64, 48), dtype=np.float32),
+    "mid_to_light": (0.3 + 0.6 * rng.random((64, 48))).astype(np.float32),
+    "constant": np.full((32, 32), 0.5, dtype=np.float32),
+    "binary": (rng.random((32, 32)) > 0.5).astype(np.float32),
+    "all_light": np.full((32, 32), 0.95, dtype=np.float32),
+}
+
+
+@pytest.mark.parametrize("name", IMAGES)
+@pytest.mark.parametrize("extreme_sigma", [0.1, 0.02, 0.001, 1e-20])
+def test_numba_matches_numpy(name, extreme_sigma):
+    img = IMAGES[name]
+    expected = compute_importance(img, extreme_sigma=extreme_sigma, use_numba=False)
+    result = compute_importance(img, extreme_sigma=extreme_sigma, use_numba=True)
+    assert result.shape == expected.shape
+    assert not np.isnan(result).any()
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_numba_matches_numpy_custom_thresholds():
+    img = IMAGES["random"]
+    kwargs = dict(extreme_threshold_low=0.2, extreme_threshold_high=0.6,
+                  extreme_downweight=0.9, mid_tone_boost=0.0)
+    expected = compute_importance(img, use_numba=False, **kwargs)
+    result = compute_importance(img, use_numba=True, **kwargs)
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+def test_numba_keeps_input_dtype():
+    img = IMAGES["random"].astype(np.float64)
+    expected = compute_importance(img, use_numba=False)
+    result = compute_importance(img, use_numba=True)
+    assert result.dtype == expected.dtype == np.float64
+    np.testing.assert_allclose(result, expected, atol=1e-5)
@@ -0,0 +1,43 @@
+"""
+Tests comparing the compiled void-and-cluster kernel against the NumPy path.
+"""
+
+import numpy as np
+import pytest
+
+import stippling_functions
+from stippling_functions import void_and_cluster
+
+pytestmark = pytest.mark.skipif(stippling_functions.numba is None, reason="numba not installed")
+
+# Smooth gradient with a darker disc, so dot placement depends on content
+yy, xx = np.mgrid[0:64, 0:48]
+IMAGE = (0.2 + 0.7 * xx / 47.0).astype(np.float32)
+IMAGE[(yy - 32) ** 2 + (xx - 24) ** 2 < 12 ** 2] *= 0.4
+
+
+@pytest.mark.parametrize("percentage", [0.02, 0.08])
+def test_numba_dot_count_and_uniqueness(percentage):
+    np.random.seed(0)
+    stipple, samples = void_and_cluster(IMAGE, percentage=percentage, use_numba=True)
+    expected = int(IMAGE.size * percentage)
+    assert samples.shape == (expected, 3)
+    assert np.count_nonzero(stipple == 0.0) == expected
+    coords = samples[:, :2].astype(np.int64)
+    assert len(np.unique(coords, axis=0)) == expected
+
+
+def test_numba_mean_tone_matches_numpy():
+    np.random.seed(0)
+    _, samples_nb = void_and_cluster(IMAGE, percentage=0.08, use_numba=True)
+    np.random.seed(0)
+    _, samples_np = void_and_cluster(IMAGE, percentage=0.08, use_numba=False)
+    assert abs(samples_nb[:, 2].mean() - samples_np[:, 2].mean()) < 0.02
+
+
+def test_numba_is_reproducible_under_seed():
+    np.random.seed(1)
+    a, _ = void_and_cluster(IMAGE, percentage=0.05, use_numba=True)
+    np.random.seed(1)
+    b, _ = void_and_cluster(IMAGE, percentage=0.05, use_numba=True)
+    np.testing.assert_array_equal(a, b)